@@ -10,24 +10,36 @@ If no backend is available, provides a SilentAudioCapture that yields None.
 All capture classes expose:
 - start()
 - stop()
-- get_audio_data() -> np.ndarray | None
+- get_audio_data() -> np.ndarray | None  (read-only view into the backend's ring buffer;
+  float32 in [-1, 1], or raw int16 PCM for parec)
 - get_device_name() -> str
 """
 from __future__ import annotations
+import re
 import sys
 import threading
-import queue
 import numpy as np
 from typing import Optional
 
 # Reuse existing Linux implementation
 from .parec_audio import ParecAudioCapture  # noqa: F401
+from .ring_buffer import RingBuffer
 
 try:
     import sounddevice as sd  # type: ignore
 except Exception:  # pragma: no cover - optional dependency fallback
     sd = None  # type: ignore
 
+_DEVICES = None
+
+
+def _query_devices():
+    """Return the PortAudio device list, queried once per process."""
+    global _DEVICES
+    if _DEVICES is None:
+        _DEVICES = sd.query_devices()  # type: ignore[attr-defined]
+    return _DEVICES
+
 
 class SilentAudioCapture:
     def __init__(self, *_, **__):
@@ -47,18 +59,19 @@ class WASAPILoopbackCapture:
     def __init__(self, sample_rate: int = 44100, chunk_size: int = 1024):
         self.sample_rate = sample_rate
         self.chunk_size = chunk_size
-        self.audio_queue: "queue.Queue[np.ndarray]" = queue.Queue(maxsize=5)
+        # Newest chunk only; views stay valid for 6 pushes (see ParecAudioCapture)
+        self.ring = RingBuffer(7, chunk_size)
         self.stream = None
         self.running = False
         self.device_name = None
 
     def _choose_loopback_device(self):
         try:
-            devices = sd.query_devices()  # type: ignore[attr-defined]
+            devices = _query_devices()
             # Prefer default output
             default_out = sd.default.device[1] if hasattr(sd, 'default') else None  # type: ignore
             if default_out is not None and default_out >= 0:
-                info = sd.query_devices(default_out)
+                info = devices[default_out]
                 self.device_name = info.get('name', 'WASAPI loopback')
                 return default_out
             # Fallback: first output device
@@ -97,21 +110,8 @@ class WASAPILoopbackCapture:
                         mono = np.mean(indata, axis=1)
                     else:
                         mono = indata[:, 0] if indata.ndim == 2 else indata
-                    # Ensure float32
-                    mono = mono.astype(np.float32)
-                    # Pad / trim to chunk_size
-                    if len(mono) < self.chunk_size:
-                        mono = np.pad(mono, (0, self.chunk_size - len(mono)))
-                    elif len(mono) > self.chunk_size:
-                        mono = mono[:self.chunk_size]
-                    try:
-                        self.audio_queue.put_nowait(mono)
-                    except queue.Full:
-                        try:
-                            self.audio_queue.get_nowait()
-                            self.audio_queue.put_nowait(mono)
-                        except queue.Empty:
-                            pass
+                    # Ring copies as float32 and pads / trims to chunk_size
+                    self.ring.push(mono)
                 except Exception:
                     pass
 
@@ -122,6 +122,7 @@ class WASAPILoopbackCapture:
                 channels=2,
                 dtype='float32',
                 device=dev,
+                latency='low',
                 callback=callback,
                 extra_settings=settings
             )
@@ -143,10 +144,7 @@ class WASAPILoopbackCapture:
     def get_audio_data(self):
         if not self.running:
             return None
-        try:
-            return self.audio_queue.get_nowait()
-        except queue.Empty:
-            return None
+        return self.ring.pop_latest()
 
     def get_device_name(self):
         return self.device_name or "WASAPI loopback"
@@ -159,11 +157,13 @@ class MacSoundDeviceCapture:
     NOTE: True system output capture on macOS generally requires installing a virtual device.
     """
     PREFERRED_KEYWORDS = ["blackhole", "loopback", "aggregate"]
+    PREFERRED_RE = re.compile('|'.join(PREFERRED_KEYWORDS), re.IGNORECASE)
 
     def __init__(self, sample_rate: int = 44100, chunk_size: int = 1024):
         self.sample_rate = sample_rate
         self.chunk_size = chunk_size
-        self.audio_queue: "queue.Queue[np.ndarray]" = queue.Queue(maxsize=5)
+        # Newest chunk only; views stay valid for 6 pushes (see ParecAudioCapture)
+        self.ring = RingBuffer(7, chunk_size)
         self.stream = None
         self.running = False
         self.device_name = None
@@ -171,18 +171,19 @@ class MacSoundDeviceCapture:
 
     def _pick_device(self):
         try:
-            devices = sd.query_devices()  # type: ignore[attr-defined]
+            devices = _query_devices()
             # Search for preferred loopback style device
-            for idx, d in enumerate(devices):
-                name = (d.get('name') or '').lower()
-                if any(k in name for k in self.PREFERRED_KEYWORDS) and d.get('max_input_channels', 0) > 0:
-                    self.device_index = idx
-                    self.device_name = d.get('name', 'loopback')
-                    return
+            idx = next((i for i, d in enumerate(devices)
+                        if d.get('max_input_channels', 0) > 0
+                        and self.PREFERRED_RE.search(d.get('name') or '')), None)
+            if idx is not None:
+                self.device_index = idx
+                self.device_name = devices[idx].get('name', 'loopback')
+                return
             # Fallback: default input
             default_in = sd.default.device[0] if hasattr(sd, 'default') else None  # type: ignore
             if default_in is not None and default_in >= 0:
-                info = sd.query_devices(default_in)
+                info = devices[default_in]
                 self.device_index = default_in
                 self.device_name = info.get('name', 'default input')
                 return
@@ -211,19 +212,7 @@ class MacSoundDeviceCapture:
                     mono = np.mean(indata, axis=1)
                 else:
                     mono = indata[:, 0] if indata.ndim == 2 else indata
-                mono = mono.astype(np.float32)
-                if len(mono) < self.chunk_size:
-                    mono = np.pad(mono, (0, self.chunk_size - len(mono)))
-                elif len(mono) > self.chunk_size:
-                    mono = mono[:self.chunk_size]
-                try:
-                    self.audio_queue.put_nowait(mono)
-                except queue.Full:
-                    try:
-                        self.audio_queue.get_nowait()
-                        self.audio_queue.put_nowait(mono)
-                    except queue.Empty:
-                        pass
+                self.ring.push(mono)
             except Exception:
                 pass
         try:
@@ -234,6 +223,7 @@ class MacSoundDeviceCapture:
                 channels=2,
                 dtype='float32',
                 device=self.device_index,
+                latency='low',
                 callback=callback
             )
             self.stream.start()
@@ -254,10 +244,7 @@ class MacSoundDeviceCapture:
     def get_audio_data(self):
         if not self.running:
             return None
-        try:
-            return self.audio_queue.get_nowait()
-        except queue.Empty:
-            return None
+        return self.ring.pop_latest()
 
     def get_device_name(self):
         return self.device_name or "input"
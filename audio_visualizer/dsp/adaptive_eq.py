@@ -7,34 +7,43 @@ values along with state updates.
 """
 from __future__ import annotations
 import numpy as np
-from typing import Dict
+from typing import TYPE_CHECKING
 
-def apply_adaptive_eq(values: np.ndarray, state: Dict, key_prefix: str = "") -> np.ndarray:
+if TYPE_CHECKING:
+    from audio_visualizer.viz_state import VizState
+
+def apply_adaptive_eq(values: np.ndarray, state: VizState, key_prefix: str = "") -> np.ndarray:
     """Apply running-mean based adaptive EQ if enabled in state.
 
     Parameters:
       values: 1-D numpy array of current magnitudes (0..1 expected)
-      state:  dict carrying 'adaptive_eq', 'adaptive_eq_strength', etc.
+      state:  VizState carrying adaptive_eq / adaptive_eq_strength; the running
+              mean is stored as an item
       key_prefix: optional prefix to allow multiple independent EQ contexts
                   within a single visualizer (e.g., "energy_", "bars_").
 
     Returns:
       Possibly adjusted array (same object is not modified in-place).
     """
-    if not state.get('adaptive_eq') or values.size == 0:
+    if not state.adaptive_eq or values.size == 0:
         return values
-    strength = float(state.get('adaptive_eq_strength', 0.4))
+    strength = float(state.adaptive_eq_strength)
     run_key = f"{key_prefix}adaptive_eq_mean"
     run_mean = state.get(run_key)
     if run_mean is None or not isinstance(run_mean, np.ndarray) or run_mean.shape != values.shape:
         run_mean = values.copy()
+        state[run_key] = run_mean
     else:
-        # Exponential moving average; small alpha for long residency
-        run_mean = 0.995 * run_mean + 0.005 * values
-    adj = values / (run_mean + 1e-6)
+        # Exponential moving average; small alpha for long residency.
+        # The stored mean is owned by state, so it is updated in place
+        run_mean *= 0.995
+        run_mean += 0.005 * values
+    # adj doubles as the output buffer: values is left untouched
+    adj = run_mean + 1e-6
+    np.divide(values, adj, out=adj)
     m = np.max(adj)
     if m > 0:
-        adj = adj / m
-    blended = (1 - strength) * values + strength * adj
-    state[run_key] = run_mean
-    return blended
+        adj /= m
+    adj *= strength
+    adj += (1 - strength) * values
+    return adj
@@ -1,7 +1,11 @@
 """DSP utilities for computing frequency bar data."""
+from functools import lru_cache
 import numpy as np
+from .fft import rfft, rfft_freqs, windowed_frame
 
-DEFAULT_FFT_SIZE = 4096
+# Capture delivers 1024-sample chunks: a 1024-point FFT windows the whole
+# chunk with a full Hann window (43 Hz bins; narrower log bands interpolate)
+DEFAULT_FFT_SIZE = 1024
 DEFAULT_SAMPLE_RATE = 44100
 
 
@@ -14,66 +18,120 @@ def _log_edges(num_bars: int, f_low: float, f_high: float):
     return centers, np.clip(edges, f_low, f_high)
 
 
-def compute_frequency_bars(audio_data: np.ndarray, num_bars: int, fft_size: int = DEFAULT_FFT_SIZE,
-                           sample_rate: int = DEFAULT_SAMPLE_RATE) -> np.ndarray:
-    if num_bars <= 0:
-        return np.array([])
-    if fft_size <= 0:
-        fft_size = DEFAULT_FFT_SIZE
+def _readonly(*arrays):
+    for a in arrays:
+        a.flags.writeable = False
+    return arrays
 
-    if len(audio_data) < fft_size:
-        audio = np.pad(audio_data, (0, fft_size - len(audio_data)), 'constant')
-    else:
-        audio = audio_data[:fft_size]
 
-    window = np.hanning(len(audio))
-    windowed = audio * window
-    fft = np.fft.rfft(windowed)
-    power = np.abs(fft) ** 2
-    freqs = np.fft.rfftfreq(len(windowed), 1.0 / sample_rate)
+@lru_cache(maxsize=16)
+def _band_layout(num_bars: int, fft_size: int, sample_rate: int):
+    """Fixed bin -> band mapping for a (num_bars, fft_size, sample_rate) combo.
 
+    Modes call with a few distinct bar counts (width, width // 2, ...), so the
+    layout is built once per terminal size instead of every frame.
+    """
+    freqs = rfft_freqs(fft_size, sample_rate)
     nyquist = sample_rate / 2.0
     f_low, f_high = 20.0, min(20000.0, nyquist * 0.999)
     if f_high <= f_low:
         f_high = nyquist * 0.999
 
     centers, edges = _log_edges(num_bars, f_low, f_high)
-    bar_vals = np.zeros(num_bars, dtype=np.float32)
-
-    for i in range(num_bars):
-        lo, hi = edges[i], edges[i+1]
-        mask = (freqs >= lo) & (freqs < hi)
-        if np.any(mask):
-            band_power = power[mask]
-            bar_vals[i] = float(np.sqrt(np.mean(band_power)))
+
+    # Band i covers the contiguous bins freqs[starts[i]:starts[i+1]]
+    bounds = np.searchsorted(freqs, edges)
+    starts, ends = bounds[:-1], bounds[1:]
+    counts = ends - starts
+    filled = counts > 0
+    # Empty bands contribute no bins, so a reduceat over the filled starts
+    # sums each filled band exactly up to the next filled start
+    f_starts = starts[filled]
+    f_counts = counts[filled]
+    f_end = int(ends[filled][-1]) if f_starts.size else 0
+
+    # Bands narrower than one bin: interpolate power at the band center
+    empty = ~filled
+    c = centers[empty]
+    idx = np.searchsorted(freqs, c)
+    lo_i = np.clip(idx - 1, 0, len(freqs) - 1)
+    hi_i = np.clip(idx, 0, len(freqs) - 1)
+    f1, f2 = freqs[lo_i], freqs[hi_i]
+    w = (c - f1) / np.maximum(1e-9, f2 - f1)
+    # Centers outside the bin range take the edge bin (lo_i == hi_i there)
+    w[(idx <= 0) | (idx >= len(freqs))] = 0.0
+
+    # Gentle high-frequency tilt for more perceptual balance
+    tilt_gain = 1.0 + 0.78 * (np.linspace(0, 1, num_bars) ** 1.15)
+
+    return _readonly(filled, f_starts, f_counts, empty, lo_i, hi_i, w, tilt_gain) + (f_end,)
+
+
+@lru_cache(maxsize=16)
+def _smooth_layout(n: int):
+    """Window / blend layout of the high-end spatial smoothing for n bars.
+
+    Bars are grouped by window half-width so each group's local means come
+    from one gather; windows clipped by the array end are listed separately.
+    """
+    keep, blends, clipped = [], [], []
+    by_half = {}
+    for i in range(n):
+        frac = i / max(1, n - 1)
+        # Window grows from 0 (no neighbors) to up to 4 neighbors each side
+        half_win = int(1 + frac * 4)  # 1..5
+        if half_win <= 1:
+            continue
+        keep.append(i)
+        # Blend amount increases toward high end (up to 65%)
+        blends.append(0.15 + 0.5 * (frac ** 1.2))
+        lo = max(0, i - half_win)
+        hi = min(n, i + half_win + 1)
+        if hi - lo == 2 * half_win + 1:
+            by_half.setdefault(half_win, []).append(i)
         else:
-            c = centers[i]
-            idx = np.searchsorted(freqs, c)
-            if idx <= 0:
-                val = power[0]
-            elif idx >= len(freqs):
-                val = power[-1]
-            else:
-                f1, f2 = freqs[idx-1], freqs[idx]
-                w = (c - f1) / max(1e-9, (f2 - f1))
-                val = (1-w)*power[idx-1] + w*power[idx]
-            bar_vals[i] = float(np.sqrt(val))
+            clipped.append((i, lo, hi))
+    groups = tuple((np.arange(-k, k + 1), np.array(idx)) for k, idx in sorted(by_half.items()))
+    blends = np.array(blends)
+    keep = np.array(keep, dtype=np.intp)
+    return _readonly(keep, 1 - blends, blends) + (groups, tuple(clipped))
+
+
+def compute_frequency_bars(audio_data: np.ndarray, num_bars: int, fft_size: int = DEFAULT_FFT_SIZE,
+                           sample_rate: int = DEFAULT_SAMPLE_RATE) -> np.ndarray:
+    if num_bars <= 0:
+        return np.array([])
+    if fft_size <= 0:
+        fft_size = DEFAULT_FFT_SIZE
+
+    fft = rfft(windowed_frame(audio_data, fft_size), overwrite_x=True)
+    # Square the magnitude in place (no second temporary)
+    power = np.abs(fft)
+    power *= power
+
+    filled, f_starts, f_counts, empty, lo_i, hi_i, w, tilt_gain, f_end = \
+        _band_layout(num_bars, fft_size, sample_rate)
+    power_sq = np.empty(num_bars, dtype=power.dtype)
+    if f_starts.size:
+        power_sq[filled] = np.add.reduceat(power[:f_end], f_starts) / f_counts
+    if lo_i.size:
+        power_sq[empty] = (1 - w) * power[lo_i] + w * power[hi_i]
+    bar_vals = np.sqrt(power_sq).astype(np.float32, copy=False)
 
     if np.any(bar_vals > 0):
         floor = np.percentile(bar_vals, 20)
         bar_vals = np.clip(bar_vals - floor * 0.15, 0, None)
         # Always apply gentle high-frequency tilt for more perceptual balance
-        idx = np.linspace(0, 1, num_bars)
-        tilt_gain = 1.0 + 0.78 * (idx ** 1.15)
         bar_vals *= tilt_gain
         baseline = np.mean(bar_vals) * 0.01
         if baseline > 0:
             bar_vals += baseline
 
+    # bar_vals is a fresh array here, so normalize and compress it in place
     max_val = np.max(bar_vals)
     if max_val > 0:
-        bar_vals = bar_vals / max_val
-    bar_vals = np.power(bar_vals, 0.7, where=bar_vals>0, out=bar_vals)
+        bar_vals /= max_val
+    np.power(bar_vals, 0.7, where=bar_vals > 0, out=bar_vals)
 
     # Adaptive spatial smoothing: higher-index (higher-frequency) bars can be
     # noisier / bumpier due to lower absolute energy and boosted tilt. We
@@ -82,24 +140,43 @@ def compute_frequency_bars(audio_data: np.ndarray, num_bars: int, fft_size: int
     # (attack/body) while evening out the brittle high end.
     n = len(bar_vals)
     if n > 8:
-        original = bar_vals.copy()
-        smoothed = bar_vals.copy()
-        for i in range(n):
-            frac = i / max(1, n - 1)
-            # Window grows from 0 (no neighbors) to up to 4 neighbors each side
-            half_win = int(1 + frac * 4)  # 1..5
-            if half_win <= 1:
-                continue
-            lo = max(0, i - half_win)
-            hi = min(n, i + half_win + 1)
-            local_mean = np.mean(original[lo:hi])
-            # Blend amount increases toward high end (up to 65%)
-            blend = 0.15 + 0.5 * (frac ** 1.2)
-            smoothed[i] = (1 - blend) * original[i] + blend * local_mean
-        bar_vals = smoothed
+        keep, w_orig, w_mean, groups, clipped = _smooth_layout(n)
+        original = bar_vals
+        local_mean = np.empty_like(original)
+        for offsets, idx in groups:
+            # (len(idx), window) gather; each row averages like original[lo:hi]
+            local_mean[idx] = np.mean(original[idx[:, None] + offsets], axis=1)
+        for i, lo, hi in clipped:
+            local_mean[i] = np.mean(original[lo:hi])
+        # Weights are rounded to the bar dtype, as Python float blends were
+        bar_vals = original.copy()
+        bar_vals[keep] = (w_orig.astype(original.dtype, copy=False) * original[keep]
+                          + w_mean.astype(original.dtype, copy=False) * local_mean[keep])
 
         # Re-normalize after smoothing to keep full 0..1 dynamic range
         mx = np.max(bar_vals)
         if mx > 0:
             bar_vals /= mx
     return bar_vals
+
+
+@lru_cache(maxsize=32)
+def _neighbor_weights(n: int, w_min: float, w_span: float):
+    w = np.array([w_min + w_span * ((i / max(1, n - 1)) ** 1.1) for i in range(1, n - 1)])
+    return _readonly(w, 1 - w)
+
+
+def smooth_neighbors(values: np.ndarray, w_min: float, w_span: float) -> np.ndarray:
+    """Blend each inner value toward its 3-point mean, in place.
+
+    The blend weight rises from w_min at the low end to w_min + w_span at the
+    high end. The whole update is one expression over the old values, so no
+    copy of them is needed.
+    """
+    if len(values) > 4:
+        w, w_keep = _neighbor_weights(len(values), w_min, w_span)
+        local_avg = (values[:-2] + values[1:-1] + values[2:]) / 3.0
+        # Weights rounded to the value dtype, as Python float weights were
+        values[1:-1] = (w_keep.astype(values.dtype, copy=False) * values[1:-1]
+                        + w.astype(values.dtype, copy=False) * local_avg)
+    return values
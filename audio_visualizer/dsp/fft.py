@@ -0,0 +1,60 @@
+"""Shared FFT helpers: cached analysis windows, frequency axes and the rfft backend.
+
+Uses scipy.fft (pocketfft with a persistent plan / twiddle cache) when it is
+installed and falls back to numpy.fft otherwise. Frames are float32: a
+terminal has a few dozen rows of resolution, and both backends keep single
+precision through the transform (complex64 out), halving the memory traffic.
+"""
+from functools import lru_cache
+import numpy as np
+
+try:
+    import scipy.fft as _fft_backend  # type: ignore
+    _HAS_OVERWRITE = True
+except Exception:  # pragma: no cover - optional dependency fallback
+    _fft_backend = np.fft
+    _HAS_OVERWRITE = False
+
+# Per-size windowed input buffers reused across frames
+_frame_bufs = {}
+
+
+@lru_cache(maxsize=8)
+def hann_window(n: int) -> np.ndarray:
+    """float32 Hann window of length n (shared, read-only)."""
+    window = np.hanning(n).astype(np.float32)
+    window.flags.writeable = False
+    return window
+
+
+@lru_cache(maxsize=8)
+def rfft_freqs(n: int, sample_rate: int) -> np.ndarray:
+    """Bin center frequencies of an n-point rfft (shared, read-only)."""
+    freqs = np.fft.rfftfreq(n, 1.0 / sample_rate)
+    freqs.flags.writeable = False
+    return freqs
+
+
+def windowed_frame(audio: np.ndarray, n: int) -> np.ndarray:
+    """Zero-pad / truncate audio to n samples and apply the n-point Hann window.
+
+    The float32 result is written into a buffer reused across calls, so it is
+    only valid until the next call with the same n.
+    """
+    buf = _frame_bufs.get(n)
+    if buf is None:
+        buf = _frame_bufs[n] = np.zeros(n, dtype=np.float32)
+    m = min(len(audio), n)
+    np.multiply(audio[:m], hann_window(n)[:m], out=buf[:m])
+    buf[m:] = 0.0
+    return buf
+
+
+def rfft(x: np.ndarray, overwrite_x: bool = False) -> np.ndarray:
+    """Real-input FFT using the fastest available backend.
+
+    overwrite_x lets scipy use x as scratch space; it is ignored by numpy.
+    """
+    if overwrite_x and _HAS_OVERWRITE:
+        return _fft_backend.rfft(x, overwrite_x=True)
+    return _fft_backend.rfft(x)
@@ -1,11 +1,12 @@
 """Audio capture using parec (PulseAudio/PipeWire recorder) for reliable system audio."""
 
 import numpy as np
+import os
 import subprocess
 import threading
-import queue
 import struct
 import sys
+from .ring_buffer import RingBuffer
 
 
 class ParecAudioCapture:
@@ -14,11 +15,17 @@ class ParecAudioCapture:
     def __init__(self, sample_rate: int = 44100, chunk_size: int = 1024):
         self.sample_rate = sample_rate
         self.chunk_size = chunk_size
-        self.audio_queue = queue.Queue(maxsize=5)  # Smaller queue for lower latency
+        # Readers take the newest chunk only (pop_latest). A returned view stays
+        # valid for slots - 1 = 6 further pushes, ~139 ms of 1024-sample chunks:
+        # well past one frame, even when a slow draw overruns its budget
+        # Raw s16le samples are kept as int16; the visualizer scales them once per frame
+        self.ring = RingBuffer(7, chunk_size, dtype=np.int16)
         self.process = None
         self.running = False
         self.capture_thread = None
         self.monitor_source = None
+        # Errors collected while curses owns the terminal (reported after exit)
+        self.messages = []
         
         # Find monitor source
         self._find_monitor_source()
@@ -44,6 +51,20 @@ class ParecAudioCapture:
             # Silent fallback to default source
             pass
     
+    def _raise_thread_priority(self):
+        """Request real-time (SCHED_FIFO) scheduling for the calling capture thread.
+
+        Keeps the reader from being preempted by the render loop. Needs
+        CAP_SYS_NICE or an rtprio limit; without them the default policy is kept.
+        """
+        if not sys.platform.startswith('linux'):
+            return
+        try:
+            # On Linux pid 0 targets the calling thread, not the whole process
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+        except (AttributeError, OSError):
+            pass
+    
     def _capture_loop(self):
         """Capture audio in a separate thread."""
         try:
@@ -59,7 +80,7 @@ class ParecAudioCapture:
                 '--rate', str(self.sample_rate),
                 '--channels', '1',
                 '--format', 's16le',  # 16-bit signed little-endian
-                '--latency-msec', '50'  # Low latency
+                '--latency-msec', '20'  # Below one 1024-sample chunk (~23 ms)
             ])
             
             # Suppress starting command output
@@ -71,6 +92,8 @@ class ParecAudioCapture:
                 stderr=subprocess.PIPE,
                 bufsize=self.chunk_size * 2  # 2 bytes per sample
             )
+            # Only after the fork: parec itself keeps the default policy
+            self._raise_thread_priority()
             
             # Read audio data
             bytes_per_chunk = self.chunk_size * 2  # 2 bytes per sample (16-bit)
@@ -83,35 +106,20 @@ class ParecAudioCapture:
                     if not data:
                         break
                     
-                    # Convert bytes to numpy array
+                    # Convert bytes to numpy array (no copy)
                     # s16le = signed 16-bit little-endian
                     audio_data = np.frombuffer(data, dtype=np.int16)
                     
-                    # Convert to float32 in range [-1, 1]
-                    audio_data = audio_data.astype(np.float32) / 32768.0
-                    
-                    # Pad if necessary
-                    if len(audio_data) < self.chunk_size:
-                        audio_data = np.pad(audio_data, (0, self.chunk_size - len(audio_data)))
-                    
-                    # Queue the data
-                    try:
-                        self.audio_queue.put_nowait(audio_data)
-                    except queue.Full:
-                        # Remove old data
-                        try:
-                            self.audio_queue.get_nowait()
-                            self.audio_queue.put_nowait(audio_data)
-                        except queue.Empty:
-                            pass
+                    # Publish raw PCM (ring pads short reads)
+                    self.ring.push(audio_data)
                 
                 except Exception as e:
                     if self.running:
-                        print(f"Error in capture loop: {e}", file=sys.stderr)
+                        self.messages.append(f"Error in capture loop: {e}")
                     break
         
         except Exception as e:
-            print(f"Error starting parec: {e}", file=sys.stderr)
+            self.messages.append(f"Error starting parec: {e}")
             self.running = False
     
     def start(self):
@@ -143,11 +151,8 @@ class ParecAudioCapture:
             self.capture_thread.join(timeout=2)
     
     def get_audio_data(self):
-        """Get latest audio data."""
-        try:
-            return self.audio_queue.get_nowait()
-        except queue.Empty:
-            return None
+        """Get the newest unread chunk as a read-only view, or None."""
+        return self.ring.pop_latest()
     
     def get_device_name(self) -> str:
         """Get the name of the current device."""
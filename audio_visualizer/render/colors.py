@@ -1,5 +1,7 @@
 """Color management utilities for the visualizer."""
 import curses
+from bisect import bisect_right
+import numpy as np
 
 SCHEMES = ["multicolor", "blue", "green", "red", "rainbow", "fire", "prism", "heat", "ocean"]
 
@@ -12,66 +14,77 @@ def init_colors():
     # Optionally could define extended pairs if terminal supports it.
 
 
+# Scheme -> (input, thresholds, pair numbers). The pair at index k is used
+# when the input is below thresholds[k] (the last pair above all of them).
+# Input is 'level', 'position' or 'blend' (level * 0.5 + position * 0.5).
+SCHEME_TABLE = {
+    "prism": ('position', (0.16, 0.32, 0.48, 0.64, 0.80), (5, 4, 3, 2, 1, 6)),
+    "rainbow": ('position', (0.2, 0.4, 0.6, 0.8), (5, 4, 3, 2, 1)),
+    # Blend position + level for more variation: green / yellow / red
+    "multicolor": ('blend', (0.33, 0.66), (3, 4, 5)),
+    "blue": ('level', (0.3, 0.7), (1, 2, 7)),
+    "green": ('level', (0.5,), (3, 4)),
+    "red": ('level', (0.5,), (4, 5)),
+    "fire": ('level', (0.3, 0.6), (5, 4, 7)),
+    # Blue -> green -> yellow -> red progression using level only
+    "heat": ('level', (0.25, 0.5, 0.75), (1, 3, 4, 5)),
+    # Cyan/blue/white based more on position for sweeping effect
+    "ocean": ('position', (0.33, 0.66), (2, 1, 7)),
+}
+
+# Scheme -> (scalar color function, input, thresholds array, attrs array)
+_schemes = {}
+
+
+def _build_scheme(scheme: str):
+    source, thresholds, pairs = SCHEME_TABLE.get(scheme, ('level', (), (3,)))
+    if curses.has_colors():
+        attrs = tuple(curses.color_pair(p) for p in pairs)
+    else:
+        attrs = (0,) * len(pairs)
+
+    # Thresholds lie inside (0, 1), so clamping level / position to 0..1
+    # cannot change which bucket they fall in; only the blend needs it.
+    if source == 'level':
+        def color(level, position=0.5):
+            return attrs[bisect_right(thresholds, level)]
+    elif source == 'position':
+        def color(level, position=0.5):
+            return attrs[bisect_right(thresholds, position)]
+    else:
+        def color(level, position=0.5):
+            level = max(0.0, min(1.0, level))
+            position = max(0.0, min(1.0, position))
+            return attrs[bisect_right(thresholds, level * 0.5 + position * 0.5)]
+    return color, source, np.array(thresholds), np.array(attrs, dtype=np.int64)
+
+
+def _scheme(scheme: str):
+    # Built on first use (after curses colors are initialized) and cached
+    entry = _schemes.get(scheme)
+    if entry is None:
+        entry = _schemes[scheme] = _build_scheme(scheme)
+    return entry
+
+
+def color_func(scheme: str):
+    """Return a (level, position) -> attr function specialized for scheme."""
+    return _scheme(scheme)[0]
+
+
+def colors_for(scheme: str, levels, positions) -> np.ndarray:
+    """Color attrs for broadcast arrays of levels / positions (same buckets as color_func)."""
+    _, source, thresholds, attrs = _scheme(scheme)
+    shape = np.broadcast(levels, positions).shape
+    if source == 'level':
+        x = levels
+    elif source == 'position':
+        x = positions
+    else:
+        x = np.clip(levels, 0.0, 1.0) * 0.5 + np.clip(positions, 0.0, 1.0) * 0.5
+    idx = np.searchsorted(thresholds, x, side='right')
+    return np.broadcast_to(attrs[idx], shape)
+
+
 def get_color(level: float, position: float, scheme: str) -> int:
-    if not curses.has_colors():
-        return 0
-    level = max(0.0, min(1.0, level))
-    position = max(0.0, min(1.0, position))
-
-    # Helper shortcuts
-    C = curses.color_pair
-
-    if scheme == "prism":
-        if position < 0.16: return C(5)
-        if position < 0.32: return C(4)
-        if position < 0.48: return C(3)
-        if position < 0.64: return C(2)
-        if position < 0.80: return C(1)
-        return C(6)
-
-    if scheme == "rainbow":
-        if position < 0.2: return C(5)
-        if position < 0.4: return C(4)
-        if position < 0.6: return C(3)
-        if position < 0.8: return C(2)
-        return C(1)
-
-    if scheme == "multicolor":
-        # Blend position + level for more variation
-        blend = (level * 0.5 + position * 0.5)
-        if blend < 0.33: return C(3)   # Green
-        if blend < 0.66: return C(4)   # Yellow
-        return C(5)                    # Red
-
-    if scheme == "blue":
-        if level < 0.3: return C(1)
-        if level < 0.7: return C(2)
-        return C(7)
-
-    if scheme == "green":
-        if level < 0.5: return C(3)
-        return C(4)
-
-    if scheme == "red":
-        if level < 0.5: return C(4)
-        return C(5)
-
-    if scheme == "fire":
-        if level < 0.3: return C(5)
-        if level < 0.6: return C(4)
-        return C(7)
-
-    if scheme == "heat":
-        # Blue -> green -> yellow -> red progression using level only
-        if level < 0.25: return C(1)
-        if level < 0.5: return C(3)
-        if level < 0.75: return C(4)
-        return C(5)
-
-    if scheme == "ocean":
-        # Cyan/blue/white based more on position for sweeping effect
-        if position < 0.33: return C(2)
-        if position < 0.66: return C(1)
-        return C(7)
-
-    return C(3)
+    return color_func(scheme)(level, position)
@@ -0,0 +1,64 @@
+"""Single-producer / single-consumer ring of fixed-size audio frames.
+
+Capture backends publish into one preallocated ``(slots, frame_len)`` array
+instead of allocating a new ndarray per chunk and passing it through a
+``queue.Queue``. The reader receives a read-only view of a slot, so the
+consumer side neither copies nor allocates.
+"""
+from __future__ import annotations
+import numpy as np
+from typing import Optional
+
+
+class RingBuffer:
+    """Lock-free SPSC ring buffer backed by one contiguous ndarray.
+
+    Only the producer advances ``head`` and only the consumer advances ``tail``;
+    each is a single integer store under the GIL, so no lock is required.
+
+    The consumer only ever takes the newest frame (``pop_latest``); older
+    unread frames are skipped. A returned view stays valid for ``slots - 1``
+    further pushes, after which the producer reuses its slot. Callers that
+    keep samples across frames must copy them.
+    """
+
+    def __init__(self, slots: int, frame_len: int, dtype=np.float32):
+        if slots < 2:
+            raise ValueError("RingBuffer needs at least 2 slots")
+        self.slots = slots
+        self.frame_len = frame_len
+        self.buf = np.zeros((slots, frame_len), dtype=dtype)
+        # Read-only views are created once; pop_latest() hands them out
+        # without allocating
+        self._views = []
+        for row in self.buf:
+            view = row.view()
+            view.flags.writeable = False
+            self._views.append(view)
+        self.head = 0
+        self.tail = 0
+
+    def push(self, frame: np.ndarray):
+        """Copy ``frame`` into the next slot (cast to the ring's dtype).
+
+        Frames shorter than ``frame_len`` are zero-padded, longer ones truncated.
+        """
+        slot = self.buf[self.head % self.slots]
+        n = min(len(frame), self.frame_len)
+        slot[:n] = frame[:n]
+        if n < self.frame_len:
+            slot[n:] = 0
+        # Publish only after the slot is fully written
+        self.head += 1
+
+    def pop_latest(self) -> Optional[np.ndarray]:
+        """Return a read-only view of the newest frame, dropping older unread ones.
+
+        For consumers that only care about the current signal: a slow frame
+        on the reader side skips ahead instead of replaying a backlog.
+        """
+        head = self.head
+        if self.tail >= head:
+            return None
+        self.tail = head
+        return self._views[(head - 1) % self.slots]
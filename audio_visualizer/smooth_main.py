@@ -11,6 +11,9 @@ from .smooth_visualizer import SmoothVisualizer
 class SmoothAudioVisualizerApp:
     """Main application using parec and smooth rendering."""
     
+    # Frames without audio before dropping to the idle frame rate (~0.5 s)
+    IDLE_FRAMES = 30
+    
     def __init__(self, stdscr):
         self.stdscr = stdscr
         self.running = True
@@ -30,27 +33,35 @@ class SmoothAudioVisualizerApp:
             self.visualizer = SmoothVisualizer(self.stdscr)
             self.audio_capture.start()
             
-            # Main loop - 60 FPS target
-            frame_time = 1.0 / 60.0
+            # Main loop - 60 FPS target, 10 FPS once the input has been idle
+            # (no new or only all-zero samples) for IDLE_FRAMES frames
+            active_frame_time = 1.0 / 60.0
+            idle_frame_time = 1.0 / 10.0
+            idle_frames = 0
             
             while self.running:
-                frame_start = time.time()
+                frame_start = time.perf_counter()
                 
                 # Get audio data
                 audio_data = self.audio_capture.get_audio_data()
+                if audio_data is None or not audio_data.any():
+                    idle_frames += 1
+                else:
+                    idle_frames = 0
+                frame_time = idle_frame_time if idle_frames > self.IDLE_FRAMES else active_frame_time
                 
                 # Visualize
                 device_name = self.audio_capture.get_device_name()
                 self.visualizer.visualize(audio_data, device_name)
                 
+                # Maintain frame rate: getch blocks for the rest of the frame
+                # budget and returns early on a keypress
+                remaining = frame_time - (time.perf_counter() - frame_start)
+                self.stdscr.timeout(max(0, int(remaining * 1000)))
+                
                 # Handle input
                 if not self.visualizer.handle_input():
                     break
-                
-                # Maintain frame rate
-                elapsed = time.time() - frame_start
-                if elapsed < frame_time:
-                    time.sleep(frame_time - elapsed)
         
         except Exception as e:
             curses.endwin()
@@ -65,6 +76,14 @@ class SmoothAudioVisualizerApp:
         return 0
 
 
+def _report_capture_messages(audio_capture):
+    """Write capture errors collected during the session in a single write."""
+    messages = getattr(audio_capture, 'messages', None)
+    if messages:
+        sys.stderr.write('\n'.join(messages) + '\n')
+        sys.stderr.flush()
+
+
 def main():
     """Entry point for smooth visualizer (silent startup)."""
     audio_capture = create_audio_capture(sample_rate=44100, chunk_size=1024)
@@ -82,6 +101,8 @@ def main():
     except Exception:
         audio_capture.stop()
         return 1
+    finally:
+        _report_capture_messages(audio_capture)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,28 @@
 """Smooth curses-based visualizer with multiple distinct modes and color schemes."""
 
 import curses
+import os
+import sys
 import numpy as np
 from typing import Optional
 from . import visualizers
 from .render import colors as color_mod
+from .viz_state import VizState
+
+# DEC private mode 2026 (synchronized output): supporting terminals hold the
+# frame until the end marker and paint it at once; others ignore it.
+_SYNC_BEGIN = b'\x1b[?2026h'
+_SYNC_END = b'\x1b[?2026l'
+
+# Key codes handled by SmoothVisualizer.handle_input
+_KEYS_QUIT = frozenset((ord('q'), ord('Q'), 27))
+_KEYS_MODE = frozenset((ord(' '),))
+_KEYS_COLOR = frozenset((ord('\n'), ord('\r')))
+_KEYS_SAVE = frozenset((ord('s'), ord('S')))
+_KEYS_EQ = frozenset((ord('w'), ord('W')))
+_KEYS_ASCII = frozenset((ord('b'), ord('B')))
+# getch() returns this once ncurses has resized stdscr after a SIGWINCH
+_KEY_RESIZE = getattr(curses, 'KEY_RESIZE', None)
 
 
 class SmoothVisualizer:
@@ -18,53 +36,87 @@ class SmoothVisualizer:
         # Mode list (bars_simple removed; ASCII handled via toggle)
         self.modes = ["bars", "spectrum", "waveform", "mirror_circular", "circular_wave", "levels", "radial_burst"]
         self.color_schemes = color_mod.SCHEMES
-        # State dict must exist before loading config
-        self.viz_state = {}
+        # Mode name -> draw function, looked up once per frame
+        self._dispatch = {
+            "bars": visualizers.draw_bars,
+            "spectrum": visualizers.draw_spectrum,
+            "waveform": visualizers.draw_waveform,
+            "mirror_circular": visualizers.draw_mirror_circular,
+            "circular_wave": visualizers.draw_circular_wave,
+            "levels": visualizers.draw_levels,
+            "radial_burst": visualizers.draw_radial_burst,
+        }
+        # Key code -> action; quit keys are checked first in handle_input
+        self._key_table = {}
+        for keys, action in ((_KEYS_MODE, self._next_mode),
+                             (_KEYS_COLOR, self._next_color),
+                             # Save config (snapshot feature removed)
+                             (_KEYS_SAVE, self._save_config),
+                             (_KEYS_EQ, self._next_eq_mode),
+                             (_KEYS_ASCII, self._toggle_ascii)):
+            self._key_table.update(dict.fromkeys(keys, action))
+        if _KEY_RESIZE is not None:
+            self._key_table[_KEY_RESIZE] = self._on_resize
+        # State must exist before loading config (defaults to medium EQ)
+        self.viz_state = VizState()
         # Persistent config
         self.config_path = 'config.json'
+        # Settings last written by _save_config
+        self._saved_config = None
         self._load_config()
-        # Ensure default medium EQ if not set by config
-        if 'adaptive_eq_mode' not in self.viz_state:
-            # Default: medium mode (1)
-            self.viz_state['adaptive_eq_mode'] = 1
-            self.viz_state['adaptive_eq'] = True
-            self.viz_state['adaptive_eq_strength'] = 0.4
         # Clamp restored indices
         self.current_mode = min(self.current_mode, len(self.modes) - 1)
         self.current_color_scheme = min(self.current_color_scheme, len(self.color_schemes) - 1)
-        self.simple_ascii = self.viz_state.get('simple_ascii', False)
         
         # Initialize curses
         curses.curs_set(0)
+        # Cursor is hidden: don't emit cursor moves after each frame's output
+        self.stdscr.leaveok(True)
+        self.stdscr.immedok(False)
+        # Frames redraw in place and never scroll, so ncurses need not look for
+        # insert / delete-line shortcuts when diffing them
+        self.stdscr.idlok(False)
         try:
             curses.use_default_colors()
         except:
             pass  # Some terminals don't support this
-        stdscr.nodelay(1)
-        stdscr.timeout(0)
+        # Input timeout is set per frame by the run loop (frame pacing)
+        try:
+            self._tty_fd = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            self._tty_fd = None
         
         # Initialize colors
         self._init_colors()
+        self._select_color_scheme()
         
         # Smoothing - reduced for responsiveness
         self.smoothing_factor = 0.6
         self.previous_values = None
         self.previous_waveform = None
+        # Scratch buffers for the in-place smoothing update
+        self._values_scratch = None
+        self._waveform_scratch = None
+        # Set on mode change: next frame seeds the history instead of blending
+        self._reseed_values = False
+        self._reseed_waveform = False
         
         # FFT parameters
-        self.fft_size = 4096
+        self.fft_size = 1024
+        # Reused float32 buffer for int16 PCM input
+        self._pcm_buf = None
         
         # Store previous frame
         self.prev_height = 0
         self.prev_width = 0
-        self.prev_bars = None
+        # Screen size, re-read only when getch() reports a resize
+        self._size = self.stdscr.getmaxyx()
         self.mode_changed = False
         
-    # (viz_state already initialized earlier)
-        
         # Clear once at start
         self.stdscr.clear()
-        self.stdscr.refresh()
+        self.stdscr.noutrefresh()
+        curses.doupdate()
     
     def _init_colors(self):
         if curses.has_colors():
@@ -77,28 +129,66 @@ class SmoothVisualizer:
             curses.init_pair(6, curses.COLOR_MAGENTA, -1)
             curses.init_pair(7, curses.COLOR_WHITE, -1)
     
-    def _get_color(self, level: float, position: float = 0.5) -> int:
+    def _select_color_scheme(self):
+        """Bind _get_color to the (level, position) function of the current scheme.
+
+        Draw functions color whole grids with colors_for(state.color_scheme, ...).
+        """
         scheme = self.color_schemes[self.current_color_scheme]
-        return color_mod.get_color(level, position, scheme)
+        self._get_color = color_mod.color_func(scheme)
+        self.viz_state.color_scheme = scheme
     
     def _apply_smoothing(self, values: np.ndarray, use_waveform: bool = False) -> np.ndarray:
-        """Apply temporal smoothing."""
+        """Apply temporal smoothing (exponential moving average, updated in place).
+
+        Returns the smoothing state array itself, so callers that adjust the
+        result in place (bars / spectrum neighbor smoothing) also feed that
+        adjustment back into the history.
+
+        The history takes the dtype of ``values``, which is float32 in every
+        mode: capture delivers float32 (int16 PCM is scaled to float32 in
+        visualize) and the dsp helpers return float32.
+        """
         if use_waveform:
-            if self.previous_waveform is None or len(self.previous_waveform) != len(values):
-                self.previous_waveform = values
-                return values
-            smoothed = (self.smoothing_factor * self.previous_waveform + 
-                       (1 - self.smoothing_factor) * values)
-            self.previous_waveform = smoothed
-            return smoothed
+            prev = self.previous_waveform
+            if prev is None or prev.shape != values.shape or prev.dtype != values.dtype:
+                # Copy: waveform samples may be a view into the capture ring buffer
+                self.previous_waveform = values.copy()
+                self._waveform_scratch = np.empty_like(self.previous_waveform)
+                self._reseed_waveform = False
+                return self.previous_waveform
+            if self._reseed_waveform:
+                # New mode: restart the history in the existing buffer
+                prev[...] = values
+                self._reseed_waveform = False
+                return prev
+            return self._ema_update(prev, values, self._waveform_scratch)
         else:
-            if self.previous_values is None or len(self.previous_values) != len(values):
-                self.previous_values = values
-                return values
-            smoothed = (self.smoothing_factor * self.previous_values + 
-                       (1 - self.smoothing_factor) * values)
-            self.previous_values = smoothed
-            return smoothed
+            prev = self.previous_values
+            if prev is None or prev.shape != values.shape or prev.dtype != values.dtype:
+                self.previous_values = values.copy()
+                self._values_scratch = np.empty_like(self.previous_values)
+                self._reseed_values = False
+                return self.previous_values
+            if self._reseed_values:
+                prev[...] = values
+                self._reseed_values = False
+                return prev
+            return self._ema_update(prev, values, self._values_scratch)
+    
+    def _ema_update(self, prev: np.ndarray, values: np.ndarray, scratch: np.ndarray) -> np.ndarray:
+        """prev = a * prev + (1 - a) * values, without temporary arrays."""
+        np.multiply(values, 1 - self.smoothing_factor, out=scratch)
+        prev *= self.smoothing_factor
+        prev += scratch
+        return prev
+    
+    def _pcm_to_float(self, pcm: np.ndarray) -> np.ndarray:
+        """Scale int16 PCM to float32 in [-1, 1], reusing one buffer across frames."""
+        if self._pcm_buf is None or len(self._pcm_buf) != len(pcm):
+            self._pcm_buf = np.empty(len(pcm), dtype=np.float32)
+        np.multiply(pcm, 1.0 / 32768.0, out=self._pcm_buf, casting='unsafe')
+        return self._pcm_buf
     
     def draw_header(self, width: int, audio_active: bool, device_name: str = ""):
         """Draw header."""
@@ -119,10 +209,10 @@ class SmoothVisualizer:
                 color_text = f"Color: {self.color_schemes[self.current_color_scheme].upper()}"
                 flags = []
                 # Flatten flag removed
-                eq_mode = self.viz_state.get('adaptive_eq_mode', 0)
+                eq_mode = self.viz_state.adaptive_eq_mode
                 if eq_mode == 1: flags.append('EQ~')
                 elif eq_mode == 2: flags.append('EQ+')
-                if self.viz_state.get('simple_ascii'): flags.append('ASCII')
+                if self.viz_state.simple_ascii: flags.append('ASCII')
                 flag_text = (' [' + ' '.join(flags) + ']') if flags else ''
                 self.stdscr.addstr(1, 2, mode_text + flag_text, curses.color_pair(2))
                 self.stdscr.addstr(1, 40, color_text, curses.color_pair(3))
@@ -152,8 +242,9 @@ class SmoothVisualizer:
     def visualize(self, audio_data: Optional[np.ndarray], device_name: str = "Unknown"):
         """Main visualization."""
         try:
-            height, width = self.stdscr.getmaxyx()
-            audio_active = audio_data is not None and len(audio_data) > 0 and np.max(np.abs(audio_data)) > 0.001
+            height, width = self._size
+            if audio_data is not None and audio_data.dtype == np.int16:
+                audio_data = self._pcm_to_float(audio_data)
             
             # No header or footer - full screen visualization
             viz_height = height
@@ -166,49 +257,44 @@ class SmoothVisualizer:
                 
                 # Clear state on mode change
                 if self.mode_changed:
-                    # Preserve user preference flags while clearing per-mode transient data
-                    persistent_keys = {
-                        'adaptive_eq', 'adaptive_eq_mode', 'adaptive_eq_strength', 'simple_ascii'
-                    }
-                    preserved = {k: v for k, v in self.viz_state.items() if k in persistent_keys}
-                    self.viz_state = preserved
+                    # Drop per-mode transient data; preference slots are kept
+                    self.viz_state.clear()
                     visualizers.base.clear_area(self.stdscr, y_offset, viz_height, viz_width)
                     self.mode_changed = False
                 
-                # Adaptive tilt factor for frequency distribution balancing
-                # Adjust after obtaining bars in modes using frequency bars
-                if 'adaptive_tilt' not in self.viz_state:
-                    self.viz_state['adaptive_tilt'] = 1.0
-
-                if mode == "bars":
-                    visualizers.draw_bars(self.stdscr, audio_data, viz_height, viz_width, y_offset,
-                                           self._get_color, self._apply_smoothing, self.viz_state)
-                elif mode == "spectrum":
-                    visualizers.draw_spectrum(self.stdscr, audio_data, viz_height, viz_width, y_offset,
-                                            self._get_color, self._apply_smoothing, self.viz_state)
-                elif mode == "waveform":
-                    visualizers.draw_waveform(self.stdscr, audio_data, viz_height, viz_width, y_offset,
-                                            self._get_color, self._apply_smoothing, self.viz_state)
-                elif mode == "mirror_circular":
-                    visualizers.draw_mirror_circular(self.stdscr, audio_data, viz_height, viz_width, y_offset,
-                                                   self._get_color, self._apply_smoothing, self.viz_state)
-                elif mode == "circular_wave":
-                    visualizers.draw_circular_wave(self.stdscr, audio_data, viz_height, viz_width, y_offset,
-                                                  self._get_color, self._apply_smoothing, self.viz_state)
-                elif mode == "levels":
-                    visualizers.draw_levels(self.stdscr, audio_data, viz_height, viz_width, y_offset,
-                                          self._get_color, self._apply_smoothing, self.viz_state)
-                elif mode == "radial_burst":
-                    visualizers.draw_radial_burst(self.stdscr, audio_data, viz_height, viz_width, y_offset,
-                                                  self._get_color, self._apply_smoothing, self.viz_state)
+                draw = self._dispatch.get(mode)
+                if draw is not None:
+                    draw(self.stdscr, audio_data, viz_height, viz_width, y_offset,
+                         self._get_color, self._apply_smoothing, self.viz_state)
             
             self.prev_height = height
             self.prev_width = width
-            self.stdscr.refresh()
+            # Nothing was drawn without new audio; skip the terminal write
+            if audio_data is not None:
+                self._present()
             
         except curses.error:
             pass
     
+    def _present(self):
+        """Flush the frame to the terminal inside a synchronized-output block."""
+        # Nothing was written this frame (e.g. no row changed): skip the flush
+        if not self.stdscr.is_wintouched():
+            return
+        # Stage the window and emit only the cells ncurses finds changed in
+        # a single doupdate() per frame
+        self.stdscr.noutrefresh()
+        if self._tty_fd is None:
+            curses.doupdate()
+            return
+        # curses has flushed everything from the previous frame, so raw writes
+        # around doupdate() land exactly before / after this frame's output
+        os.write(self._tty_fd, _SYNC_BEGIN)
+        try:
+            curses.doupdate()
+        finally:
+            os.write(self._tty_fd, _SYNC_END)
+    
     def handle_input(self) -> bool:
         """Handle keyboard input."""
         try:
@@ -217,71 +303,53 @@ class SmoothVisualizer:
             if key == -1 or key == curses.ERR:
                 return True
             
-            if key == ord('q') or key == ord('Q') or key == 27:
+            if key in _KEYS_QUIT:
                 return False
-            elif key == ord(' '):
-                # Change mode
-                self.current_mode = (self.current_mode + 1) % len(self.modes)
-                self.previous_values = None
-                self.previous_waveform = None
-                self.prev_bars = None
-                self.mode_changed = True
-                self.prev_width = 0
-                self.prev_height = 0
-            elif key == ord('\n') or key == ord('\r') or key == 10 or key == 13:
-                # Change color scheme
-                self.current_color_scheme = (self.current_color_scheme + 1) % len(self.color_schemes)
-                self.prev_width = 0
-                self.prev_height = 0
-            elif key == ord('s') or key == ord('S'):
-                # Save config (snapshot feature removed)
-                self._save_config()
-            # 'F' flatten toggle removed (legacy)
-            elif key == ord('w') or key == ord('W'):
-                # Cycle adaptive EQ mode: 0 (off) -> 1 (medium) -> 2 (strong)
-                mode = self.viz_state.get('adaptive_eq_mode', 0)
-                mode = (mode + 1) % 3
-                self.viz_state['adaptive_eq_mode'] = mode
-                if mode == 0:
-                    self.viz_state['adaptive_eq'] = False
-                    self.viz_state['adaptive_eq_strength'] = 0.0
-                elif mode == 1:
-                    self.viz_state['adaptive_eq'] = True
-                    self.viz_state['adaptive_eq_strength'] = 0.4
-                else:
-                    self.viz_state['adaptive_eq'] = True
-                    self.viz_state['adaptive_eq_strength'] = 0.65
-                if 'adaptive_eq_mean' in self.viz_state:
-                    del self.viz_state['adaptive_eq_mean']
-                self.prev_width = 0
-                self.prev_height = 0
-            elif key == ord('b') or key == ord('B'):
-                # Toggle global simple ascii flag for bar-style modes
-                self.viz_state['simple_ascii'] = not self.viz_state.get('simple_ascii', False)
-                self.simple_ascii = self.viz_state['simple_ascii']
-                self.prev_width = 0
-                self.prev_height = 0
-            # Removed: 'P' key (redundant with S)
+            handler = self._key_table.get(key)
+            if handler is not None:
+                handler()
+            # Removed: 'F' flatten toggle (legacy) and 'P' key (redundant with S)
         
         except curses.error:
             pass
         
         return True
 
+    def _next_mode(self):
+        self.current_mode = (self.current_mode + 1) % len(self.modes)
+        # Smoothing history restarts on the next frame, reusing its buffers
+        self._reseed_values = True
+        self._reseed_waveform = True
+        self.mode_changed = True
+
+    def _next_color(self):
+        self.current_color_scheme = (self.current_color_scheme + 1) % len(self.color_schemes)
+        self._select_color_scheme()
+
+    def _next_eq_mode(self):
+        # Cycle adaptive EQ mode: 0 (off) -> 1 (medium) -> 2 (strong)
+        self.viz_state.set_eq_mode((self.viz_state.adaptive_eq_mode + 1) % 3)
+        if 'adaptive_eq_mean' in self.viz_state:
+            del self.viz_state['adaptive_eq_mean']
+
+    def _toggle_ascii(self):
+        # Global simple ascii flag for bar-style modes
+        self.viz_state.simple_ascii = not self.viz_state.simple_ascii
+
+    def _on_resize(self):
+        self._size = self.stdscr.getmaxyx()
+
     # Snapshot functionality removed: S now directly saves config
 
     # ------------------ Config Persistence ------------------
     def _load_config(self):
-        import json, os
+        import json
         if not os.path.exists(self.config_path):
-            # Set default medium EQ when no config exists
-            self.viz_state['adaptive_eq_mode'] = 1
-            self.viz_state['adaptive_eq'] = True
-            self.viz_state['adaptive_eq_strength'] = 0.4
+            # No config: keep VizState defaults (medium EQ)
             return
         try:
-            with open(self.config_path, 'r') as f:
-                cfg = json.load(f)
+            with open(self.config_path, 'rb') as f:
+                cfg = json.loads(f.read())
             legacy_idx = cfg.get('current_mode', 0)
             saved_name = cfg.get('mode_name')
             if saved_name and saved_name in self.modes:
@@ -296,38 +364,20 @@ class SmoothVisualizer:
                 self.current_mode = max(0, min(legacy_idx, len(self.modes) - 1))
             self.current_color_scheme = cfg.get('current_color_scheme', 0)
             # Legacy flatten removed; ignore if present
-            self.viz_state['adaptive_eq'] = cfg.get('adaptive_eq', False)
-            self.viz_state['simple_ascii'] = cfg.get('simple_ascii', False)
+            self.viz_state.simple_ascii = cfg.get('simple_ascii', False)
             # Infer or load adaptive_eq_mode
             if 'adaptive_eq_mode' in cfg:
-                self.viz_state['adaptive_eq_mode'] = cfg.get('adaptive_eq_mode', 1)
+                eq_mode = cfg.get('adaptive_eq_mode', 1)
+            elif cfg.get('adaptive_eq'):
+                # Derive from strength if present (default medium)
+                eq_mode = 2 if cfg.get('adaptive_eq_strength', 0.0) >= 0.6 else 1
+            elif cfg.get('adaptive_eq') is False:
+                # If off but user previously disabled, keep off
+                eq_mode = 0
             else:
-                # Derive from strength if present
-                strength = cfg.get('adaptive_eq_strength', 0.0)
-                if self.viz_state.get('adaptive_eq'):
-                    if strength >= 0.6:
-                        self.viz_state['adaptive_eq_mode'] = 2
-                    elif strength >= 0.25:
-                        self.viz_state['adaptive_eq_mode'] = 1
-                    else:
-                        self.viz_state['adaptive_eq_mode'] = 1  # default medium
-                else:
-                    # If off but user previously disabled, keep off
-                    if cfg.get('adaptive_eq') is False:
-                        self.viz_state['adaptive_eq_mode'] = 0
-                    else:
-                        self.viz_state['adaptive_eq_mode'] = 1
-            # Apply normalized strength based on inferred mode if we derived it
-            mode = self.viz_state.get('adaptive_eq_mode', 1)
-            if mode == 0:
-                self.viz_state['adaptive_eq'] = False
-                self.viz_state['adaptive_eq_strength'] = 0.0
-            elif mode == 1:
-                self.viz_state['adaptive_eq'] = True
-                self.viz_state['adaptive_eq_strength'] = 0.4
-            else:
-                self.viz_state['adaptive_eq'] = True
-                self.viz_state['adaptive_eq_strength'] = 0.65
+                eq_mode = 1
+            # Normalized strength follows from the mode
+            self.viz_state.set_eq_mode(eq_mode)
         except Exception:
             pass
 
@@ -337,12 +387,19 @@ class SmoothVisualizer:
             'current_mode': self.current_mode,  # still write index for backward compat
             'mode_name': self.modes[self.current_mode],
             'current_color_scheme': self.current_color_scheme,
-            'adaptive_eq': self.viz_state.get('adaptive_eq', False),
-            'adaptive_eq_mode': self.viz_state.get('adaptive_eq_mode', 1),
-            'simple_ascii': self.viz_state.get('simple_ascii', False)
+            'adaptive_eq': self.viz_state.adaptive_eq,
+            'adaptive_eq_mode': self.viz_state.adaptive_eq_mode,
+            'simple_ascii': self.viz_state.simple_ascii
         }
+        # Repeated saves of unchanged settings skip the disk write
+        if cfg == self._saved_config and os.path.exists(self.config_path):
+            return
+        # Write to a temp file and swap it in so a crash never leaves a torn config
+        tmp_path = self.config_path + '.tmp'
         try:
-            with open(self.config_path, 'w') as f:
+            with open(tmp_path, 'w') as f:
                 json.dump(cfg, f, indent=2)
+            os.replace(tmp_path, self.config_path)
+            self._saved_config = cfg
         except Exception:
             pass
\ No newline at end of file
@@ -1,9 +1,10 @@
 """Bars visualizer - classic frequency bars."""
 
 import numpy as np
-import curses
-from audio_visualizer.dsp.bars import compute_frequency_bars
+from .base import draw_cells
+from audio_visualizer.dsp.bars import compute_frequency_bars, smooth_neighbors
 from audio_visualizer.dsp.adaptive_eq import apply_adaptive_eq
+from audio_visualizer.render.colors import colors_for
 
 
 def draw_bars(stdscr, audio_data: np.ndarray, height: int, width: int, y_offset: int, 
@@ -15,40 +16,23 @@ def draw_bars(stdscr, audio_data: np.ndarray, height: int, width: int, y_offset:
     bar_heights = apply_adaptive_eq(bar_heights, state)
     bar_heights = apply_smoothing_func(bar_heights, False)
     # Light spatial neighbor smoothing: stronger on higher-frequency indices
-    if len(bar_heights) > 4:
-        original = bar_heights.copy()
-        for i in range(1, len(bar_heights)-1):
-            frac = i / max(1, len(bar_heights)-1)
-            w = 0.15 + 0.35 * (frac ** 1.1)  # up to ~0.5 at high end
-            local_avg = (original[i-1] + original[i] + original[i+1]) / 3.0
-            bar_heights[i] = (1 - w) * original[i] + w * local_avg
+    smooth_neighbors(bar_heights, 0.15, 0.35)  # up to ~0.5 at high end
     current_bars = (bar_heights * height).astype(int)
 
-    # Store for snapshot/debug
-    state['last_bar_values'] = bar_heights.copy()
+    ncols = min(width, len(current_bars))
+    # Cell (row, col) lies k = height - row rows above the bottom edge
+    k = np.arange(height, 0, -1)[:, None]
+    lit = k <= current_bars[None, :ncols]
+    # Per-cell gradient colors for the whole frame in one vectorized lookup
+    rel_level = k / np.maximum(1, current_bars[None, :ncols])
+    levels = bar_heights[:ncols] * 0.5 + (rel_level * 0.5).astype(bar_heights.dtype)
+    positions = np.arange(ncols) / max(1, width - 1)
+    colors = colors_for(state.color_scheme, levels, positions)
     
-    # Always clear and redraw all columns for bars mode to prevent artifacts
-    for col in range(min(width, len(current_bars))):
-        cur_height = current_bars[col]
-        
-        # Clear the entire column
-        for row in range(height):
-            try:
-                stdscr.addch(row + y_offset, col, ord(' '))
-            except curses.error:
-                pass
-        
-        # Draw new bar from bottom up with vertical gradient color
-        height_ratio = bar_heights[col]
-        position = col / max(1, width - 1)
-        
-        simple = state.get('simple_ascii')
-        for row in range(height):
-            if height - row <= cur_height:
-                rel_level = (height - row) / max(1, cur_height)
-                color = get_color_func(min(1.0, height_ratio * 0.5 + rel_level * 0.5), position)
-                ch = '|' if simple else '█'
-                try:
-                    stdscr.addch(row + y_offset, col, ord(ch), color)
-                except curses.error:
-                    pass
\ No newline at end of file
+    # Unlit cells are blanks, so no stale glyphs survive a falling bar
+    ch = '|' if state.simple_ascii else '█'
+    codes = np.where(lit, ord(ch), ord(' '))
+    attrs = np.where(lit, colors, 0)
+    # Only rows that changed since the last frame are rewritten
+    draw_cells(stdscr, y_offset, 0, codes, attrs, width, state.get('cells'))
+    state['cells'] = (codes, attrs)
@@ -14,6 +14,49 @@ def clear_area(stdscr, y_start: int, height: int, width: int):
             pass
 
 
+def draw_cells(stdscr, y_start: int, x_start: int, codes: np.ndarray, attrs: np.ndarray, width: int,
+               prev=None):
+    """Write a grid of cells with one addstr per run of equal attributes.
+
+    codes: (rows, cols) array of code points; attrs: matching curses attrs.
+    Columns past ``width`` are dropped, since addstr would wrap them onto the
+    next row where per-cell addch would simply fail.
+
+    prev: the (codes, attrs) drawn at the same place last frame, if the
+    caller still owns that area; only the changed span of each row that
+    differs is rewritten.
+    """
+    import curses
+    cols = min(codes.shape[1], width - x_start)
+    if cols <= 0:
+        return
+    same_shape = prev is not None and prev[0].shape == codes.shape
+    codes = np.ascontiguousarray(codes[:, :cols], dtype='<u4')
+    attrs = attrs[:, :cols]
+    if same_shape:
+        changed = (codes != prev[0][:, :cols]) | (attrs != prev[1][:, :cols])
+        rows = np.flatnonzero(changed.any(axis=1))
+    else:
+        changed = None
+        rows = range(codes.shape[0])
+    for row in rows:
+        lo, hi = 0, cols
+        if changed is not None:
+            # Rewrite only the span between the first and last changed cell
+            hit = np.flatnonzero(changed[row])
+            lo, hi = int(hit[0]), int(hit[-1]) + 1
+        text = codes[row].tobytes().decode('utf-32-le')
+        row_attrs = attrs[row]
+        bounds = [lo, *(np.flatnonzero(row_attrs[lo + 1:hi] != row_attrs[lo:hi - 1]) + lo + 1).tolist(), hi]
+        y = y_start + row
+        for start, end in zip(bounds, bounds[1:]):
+            try:
+                stdscr.addstr(y, x_start + start, text[start:end], int(row_attrs[start]))
+            except curses.error:
+                # Writing the bottom-right cell raises after drawing it
+                pass
+
+
 def verify_bar_distribution(bar_values: np.ndarray) -> dict:
     """Return simple metrics to assess left/right balance of bar array.
 
@@ -1,8 +1,25 @@
 """Circular wave visualizer - circle with waveform modulation."""
 
+from functools import lru_cache
 import numpy as np
 import curses
 from .base import clear_area
+from audio_visualizer.render.colors import colors_for
+
+
+@lru_cache(maxsize=8)
+def _circle_trig(num_points: int):
+    """cos / sin of num_points + 1 angles evenly spaced around the circle."""
+    angles = (np.arange(num_points + 1) / num_points) * 2 * np.pi
+    cos_a, sin_a = np.cos(angles), np.sin(angles)
+    cos_a.flags.writeable = sin_a.flags.writeable = False
+    return cos_a, sin_a
+
+
+# Pulsing inner ring: a dot every 8 degrees
+_RING_DEG = np.arange(0, 360, 8)
+_RING_COS = np.cos(np.deg2rad(_RING_DEG))
+_RING_SIN = np.sin(np.deg2rad(_RING_DEG))
 
 
 def draw_circular_wave(stdscr, audio_data: np.ndarray, height: int, width: int, y_offset: int,
@@ -20,8 +37,10 @@ def draw_circular_wave(stdscr, audio_data: np.ndarray, height: int, width: int,
         waveform = np.pad(audio_data, (0, num_samples - len(audio_data)), 'constant')
     
     waveform = apply_smoothing_func(waveform, True)
-    if np.max(np.abs(waveform)) > 0:
-        waveform = waveform / np.max(np.abs(waveform))
+    # Normalize into a new array: the smoothed values are the EMA history
+    peak = max(waveform.max(), -waveform.min())
+    if peak > 0:
+        waveform = waveform / peak
     
     center_y = height // 2
     center_x = width // 2
@@ -40,33 +59,43 @@ def draw_circular_wave(stdscr, audio_data: np.ndarray, height: int, width: int,
     energy_sm = 0.9 * energy_sm + 0.1 * energy
     state['energy_sm'] = energy_sm
 
-    for i in range(num_draw_points + 1):  # +1 to close the circle
-        angle = (i / num_draw_points) * 2 * np.pi
+    # Per-point angles, waveform samples and colors for the whole circle at
+    # once; only the radius smoothing below is sequential
+    cos_a, sin_a = _circle_trig(num_draw_points)
+    frac = np.arange(num_draw_points + 1) / num_draw_points
+    wave_offsets = waveform[(frac * num_samples).astype(int) % num_samples] * base_radius * 0.7
+    targets = base_radius + wave_offsets
+    # Smooth abrupt radius jumps using previous radius (store in state)
+    radii = np.empty(num_draw_points + 1, dtype=np.result_type(targets, np.float32))
+    prev_r = state.get('prev_radius', base_radius)
+    for i in range(num_draw_points + 1):
+        prev_r = 0.5 * prev_r + 0.5 * targets[i]
+        radii[i] = prev_r
+    state['prev_radius'] = prev_r
 
-        # Sample waveform (interpolate between samples)
-        waveform_idx = int((i / num_draw_points) * num_samples) % num_samples
-        wave_offset = waveform[waveform_idx] * base_radius * 0.7  # more dramatic
-        # Smooth abrupt radius jumps using previous radius (store in state)
-        prev_r = state.get('prev_radius', base_radius)
-        target_r = base_radius + wave_offset
-        radius = 0.5 * prev_r + 0.5 * target_r
-        state['prev_radius'] = radius
-        
-        # Calculate position
-        x = int(center_x + radius * np.cos(angle))
-        y = int(center_y + radius * np.sin(angle) * 0.6)  # Slightly less vertical squish
-        
-        # Get color
-        position = i / max(1, num_draw_points - 1)
-        intensity = abs(wave_offset / base_radius) if base_radius > 0 else 0
-        color = get_color_func(intensity * 0.7 + energy_sm * 0.3, position)
+    xs = (center_x + radii * cos_a).astype(int).tolist()
+    ys = (center_y + radii * sin_a * 0.6).astype(int).tolist()  # Slightly less vertical squish
+    if base_radius > 0:
+        intensity = np.abs(wave_offsets / base_radius)
+    else:
+        intensity = np.zeros_like(wave_offsets)
+    positions = np.arange(num_draw_points + 1) / max(1, num_draw_points - 1)
+    colors = colors_for(state.color_scheme, intensity * 0.7 + energy_sm * 0.3, positions).tolist()
+
+    # Glyph code points picked once per frame, not per cell
+    simple = state.simple_ascii
+    ch_point = ord('*' if simple else '█')
+    ch_spark = ord('*' if simple else '✦')
+    ch_ray = ord('|' if simple else '·')
+    ch_dot = ord('.')
+
+    for i in range(num_draw_points + 1):  # +1 to close the circle
+        x, y, color = xs[i], ys[i], colors[i]
         
         # Draw current point
-        simple = state.get('simple_ascii')
-        ch_point = '*' if simple else '█'
         if 0 <= x < width and 0 <= y < height:
             try:
-                stdscr.addch(y + y_offset, x, ord(ch_point), color)
+                stdscr.addch(y + y_offset, x, ch_point, color)
             except curses.error:
                 pass
         
@@ -85,7 +114,7 @@ def draw_circular_wave(stdscr, audio_data: np.ndarray, height: int, width: int,
                     
                     if 0 <= interp_x < width and 0 <= interp_y < height:
                         try:
-                            stdscr.addch(interp_y + y_offset, interp_x, ord(ch_point), color)
+                            stdscr.addch(interp_y + y_offset, interp_x, ch_point, color)
                         except curses.error:
                             pass
         
@@ -119,20 +148,19 @@ def draw_circular_wave(stdscr, audio_data: np.ndarray, height: int, width: int,
                 spark_int = min(1.0, (1 - life_ratio) * 1.2)
                 c = get_color_func(spark_int, (np.cos(sp['a']) + 1)/2)
                 try:
-                    stdscr.addch(sy + y_offset, sx, ord('*' if state.get('simple_ascii') else '✦'), c)
+                    stdscr.addch(sy + y_offset, sx, ch_spark, c)
                 except curses.error:
                     pass
     state['sparks'] = new_sparks
 
     # Pulsing inner ring ( faint )
     inner_r = int(base_radius * (0.55 + 0.1 * np.sin(energy_sm * 10 + center_x)))
-    for a_i in range(0, 360, 8):
-        a = np.deg2rad(a_i)
-        x = int(center_x + inner_r * np.cos(a))
-        y = int(center_y + inner_r * np.sin(a) * 0.6)
+    ring_xs = (center_x + inner_r * _RING_COS).astype(int).tolist()
+    ring_ys = (center_y + inner_r * _RING_SIN * 0.6).astype(int).tolist()
+    for a_i, x, y in zip(_RING_DEG.tolist(), ring_xs, ring_ys):
         if 0 <= x < width and 0 <= y < height:
             try:
-                stdscr.addch(y + y_offset, x, ord('.'), get_color_func(energy_sm * 0.5 + 0.1, (a_i/360)))
+                stdscr.addch(y + y_offset, x, ch_dot, get_color_func(energy_sm * 0.5 + 0.1, (a_i/360)))
             except curses.error:
                 pass
 
@@ -158,7 +186,7 @@ def draw_circular_wave(stdscr, audio_data: np.ndarray, height: int, width: int,
                     inten = (1-frac) * (step/length)
                     c = get_color_func(inten, (dx+1)/2)
                     try:
-                        stdscr.addch(ry + y_offset, rx, ord('|' if state.get('simple_ascii') else '·'), c)
+                        stdscr.addch(ry + y_offset, rx, ch_ray, c)
                     except curses.error:
                         pass
     state['rays'] = new_rays
@@ -174,6 +202,6 @@ def draw_circular_wave(stdscr, audio_data: np.ndarray, height: int, width: int,
         if 0 <= hx < width and 0 <= hy < height:
             lvl = 0.2 + 0.8 * rng() * energy_sm
             try:
-                stdscr.addch(hy + y_offset, hx, ord('.'), get_color_func(lvl, (np.cos(a)+1)/2))
+                stdscr.addch(hy + y_offset, hx, ch_dot, get_color_func(lvl, (np.cos(a)+1)/2))
             except curses.error:
                 pass
\ No newline at end of file
@@ -12,6 +12,7 @@ Upgrades:
 import numpy as np
 import curses
 from .base import clear_area
+from audio_visualizer.dsp.fft import rfft, rfft_freqs, windowed_frame
 
 
 def draw_levels(stdscr, audio_data: np.ndarray, height: int, width: int, y_offset: int,
@@ -22,15 +23,13 @@ def draw_levels(stdscr, audio_data: np.ndarray, height: int, width: int, y_offse
     fading trail. Uses adaptive normalization to keep all bands active.
     """
     # Process FFT for specific frequency ranges
-    fft_size = 4096
-    if len(audio_data) < fft_size:
-        audio_data = np.pad(audio_data, (0, fft_size - len(audio_data)), 'constant')
-    
-    # Apply window to reduce leakage that exaggerates low bins
-    window = np.hanning(fft_size)
-    fft = np.fft.rfft(audio_data[:fft_size] * window)
-    power = (np.abs(fft) ** 2)
-    freqs = np.fft.rfftfreq(fft_size, 1.0 / 44100)
+    fft_size = 1024  # one capture chunk
+    # Windowed frame (window reduces leakage that exaggerates low bins)
+    fft = rfft(windowed_frame(audio_data, fft_size), overwrite_x=True)
+    # Square the magnitude in place (no second temporary)
+    power = np.abs(fft)
+    power *= power
+    freqs = rfft_freqs(fft_size, 44100)
     
     # Frequency ranges (tuned for musical balance)
     ranges = [
@@ -109,9 +108,6 @@ def draw_levels(stdscr, audio_data: np.ndarray, height: int, width: int, y_offse
     # Clear area
     clear_area(stdscr, y_offset, height, width)
 
-    # Store snapshot data
-    state['last_levels'] = list(zip([n for n,_ in levels], disp_levels))
-
     num_bands = len(disp_levels)
     # Compute column width per band
     gap = 2
@@ -119,6 +115,15 @@ def draw_levels(stdscr, audio_data: np.ndarray, height: int, width: int, y_offse
     col_w = max(6, usable_w // num_bands)
     meter_height = max(5, height - 4)
     base_y = y_offset + height - 2
+    white = curses.color_pair(7)
+    # Rows that fit the area, worked out once instead of failing per write
+    label_visible = base_y >= y_offset
+    pct_y = base_y - meter_height - 1
+    visible_rows = max(0, min(meter_height, base_y - y_offset))
+    simple = state.simple_ascii
+    fill_glyph = '#' if simple else '█'
+    trail_glyph = '+' if simple else '▒'
+    peak_ch = '-' if simple else '─'
 
     # Draw each band as vertical bar
     for i, (name, _) in enumerate(levels):
@@ -126,13 +131,7 @@ def draw_levels(stdscr, audio_data: np.ndarray, height: int, width: int, y_offse
         peak = peaks[i]
         position = i / max(1, num_bands - 1)
         col_x = gap + i * (col_w + gap)
-
-        # Label (centered under column)
-        label = name.center(col_w)
-        try:
-            stdscr.addstr(base_y, col_x, label[:col_w], curses.color_pair(7) | curses.A_BOLD)
-        except curses.error:
-            pass
+        span = min(col_w, width - col_x)
 
         # Height of active segment
         h_active = int(val * meter_height)
@@ -140,7 +139,7 @@ def draw_levels(stdscr, audio_data: np.ndarray, height: int, width: int, y_offse
 
         # Trail memory buffer (per band) for fade effect
         trails = state.get('trails')
-        if trails is None or len(trails) != num_bands:
+        if trails is None or len(trails) != num_bands or len(trails[i]) != meter_height:
             trails = [np.zeros(meter_height) for _ in range(num_bands)]
         # Decay trails
         trails[i] *= 0.88
@@ -150,34 +149,42 @@ def draw_levels(stdscr, audio_data: np.ndarray, height: int, width: int, y_offse
         state['trails'] = trails
 
         band_trail = trails[i]
+        # Column starts past the right edge: nothing of it is visible
+        if span <= 0:
+            continue
+
+        # Label (centered under column)
+        if label_visible:
+            label = name.center(col_w)
+            try:
+                stdscr.addstr(base_y, col_x, label[:col_w], white | curses.A_BOLD)
+            except curses.error:
+                pass
+
+        # Row strings for this column, built once rather than per row
+        fill_run = fill_glyph * span
+        trail_run = trail_glyph * span
 
         # Draw from bottom (row 0) upward
-        for level_row in range(meter_height):
-            filled = level_row < h_active
+        for level_row in range(visible_rows):
             trail_val = band_trail[level_row]
-            rel = level_row / max(1, meter_height - 1)
+            # Choose glyph based on whether inside active, trail, or empty
+            if level_row < h_active:
+                run = fill_run
+            elif trail_val > 0.05:
+                run = trail_run
+            else:
+                continue
             # Color intensity combines fill, trail and glow
             intensity = (0.5 * trail_val + 0.5 * val) * (0.6 + 0.4 * glow_norm)
             intensity = min(1.0, intensity)
             color = get_color_func(intensity, position)
-            screen_y = base_y - 1 - level_row
-            if screen_y < y_offset or screen_y >= y_offset + height:
-                continue
-            # Choose glyph based on whether inside active, trail, or empty
-            simple = state.get('simple_ascii')
-            if filled:
-                glyph = '#' if simple else '█'
-            elif trail_val > 0.05:
-                glyph = '+' if simple else '▒'
-            else:
-                glyph = ' '
-            # Draw horizontal span for thickness
-            for dx in range(col_w):
-                try:
-                    if glyph != ' ':
-                        stdscr.addch(screen_y, col_x + dx, ord(glyph), color)
-                except curses.error:
-                    pass
+            # Draw horizontal span for thickness (one addstr, clipped to the
+            # screen edge since addstr would wrap where addch just fails)
+            try:
+                stdscr.addstr(base_y - 1 - level_row, col_x, run, color)
+            except curses.error:
+                pass
 
         # Peak indicator (falling)
         if peak_row > 0:
@@ -185,16 +192,15 @@ def draw_levels(stdscr, audio_data: np.ndarray, height: int, width: int, y_offse
             if y_offset <= py < y_offset + height - 1:
                 try:
                     peak_color = get_color_func(1.0, position) | curses.A_BOLD
-                    peak_ch = '-' if state.get('simple_ascii') else '─'
-                    for dx in range(col_w):
-                        stdscr.addch(py, col_x + dx, ord(peak_ch), peak_color)
+                    stdscr.addstr(py, col_x, peak_ch * span, peak_color)
                 except curses.error:
                     pass
 
         # Percentage centered above column top
         pct = int(val * 100)
         pct_str = f"{pct:3d}%"
-        try:
-            stdscr.addstr(base_y - meter_height - 1, col_x, pct_str[:col_w], curses.color_pair(7))
-        except curses.error:
-            pass
\ No newline at end of file
+        if pct_y >= y_offset:
+            try:
+                stdscr.addstr(pct_y, col_x, pct_str[:col_w], white)
+            except curses.error:
+                pass
\ No newline at end of file
@@ -1,9 +1,10 @@
 """Mirror circular visualizer - vertical bars from center."""
 
 import numpy as np
-import curses
+from .base import draw_cells
 from audio_visualizer.dsp.bars import compute_frequency_bars
 from audio_visualizer.dsp.adaptive_eq import apply_adaptive_eq
+from audio_visualizer.render.colors import colors_for
 
 
 def draw_mirror_circular(stdscr, audio_data: np.ndarray, height: int, width: int, y_offset: int,
@@ -13,36 +14,20 @@ def draw_mirror_circular(stdscr, audio_data: np.ndarray, height: int, width: int
     bar_heights = compute_frequency_bars(audio_data, num_bars, sample_rate=44100)
     bar_heights = apply_adaptive_eq(bar_heights, state)
     bar_heights = apply_smoothing_func(bar_heights, False)
-    state['last_bar_values'] = bar_heights.copy()
     center = height // 2
-    
-    for i in range(num_bars):
-        bar_height = int(bar_heights[i] * center)
-        position = i / max(1, num_bars - 1)
-        color = get_color_func(bar_heights[i], position)
-        
-        # Left half
-        col_left = num_bars - i - 1
-        # Right half
-        col_right = num_bars + i
-        
-        for col in [col_left, col_right]:
-            if col >= width:
-                continue
-            
-            # Clear column
-            for row in range(height):
-                try:
-                    stdscr.addch(row + y_offset, col, ord(' '))
-                except curses.error:
-                    pass
-            
-            # Draw from center outward
-            simple = state.get('simple_ascii')
-            ch = '|' if simple else '█'
-            for offset in range(bar_height):
-                try:
-                    stdscr.addch(center - offset + y_offset, col, ord(ch), color)
-                    stdscr.addch(center + offset + y_offset, col, ord(ch), color)
-                except curses.error:
-                    pass
\ No newline at end of file
+
+    # Bar i fills column num_bars - 1 - i (left half) and num_bars + i (right
+    # half), from the center row outward to bar_height - 1 rows either side
+    bar_idx = np.concatenate((np.arange(num_bars)[::-1], np.arange(num_bars)))
+    bar_cells = (bar_heights * center).astype(int)[bar_idx]
+    lit = np.abs(np.arange(height) - center)[:, None] < bar_cells[None, :]
+    positions = np.arange(num_bars) / max(1, num_bars - 1)
+    colors = colors_for(state.color_scheme, bar_heights, positions)[bar_idx]
+
+    # Unlit cells are blanks, so each frame fully replaces the last
+    ch = ord('|' if state.simple_ascii else '█')
+    codes = np.where(lit, ch, ord(' '))
+    attrs = np.where(lit, colors, 0)
+    # Only rows that changed since the last frame are rewritten
+    draw_cells(stdscr, y_offset, 0, codes, attrs, width, state.get('cells'))
+    state['cells'] = (codes, attrs)
@@ -10,6 +10,13 @@ import numpy as np
 import curses
 from audio_visualizer.dsp.bars import compute_frequency_bars
 from audio_visualizer.dsp.adaptive_eq import apply_adaptive_eq
+from audio_visualizer.render.colors import colors_for
+
+# Star glyphs by intensity (a star gets the glyph past the last step it exceeds)
+_STAR_STEPS = np.array([0.3, 0.5, 0.75])
+_STAR_GLYPHS = np.array([ord('·'), ord('•'), ord('✧'), ord('✦')])
+_ASCII_STEPS = np.array([0.4, 0.7])
+_ASCII_GLYPHS = np.array([ord('.'), ord('+'), ord('*')])
 
 
 def draw_radial_burst(stdscr, audio_data: np.ndarray, height: int, width: int, y_offset: int,
@@ -30,7 +37,6 @@ def draw_radial_burst(stdscr, audio_data: np.ndarray, height: int, width: int, y
     bands = compute_frequency_bars(audio_data, num_energy_bands, sample_rate=44100)
     bands = apply_adaptive_eq(bands, state)
     bands = apply_smoothing_func(bands, False)
-    state['last_bar_values'] = bands.copy()
 
     cx, cy = width // 2, height // 2
 
@@ -121,35 +127,32 @@ def draw_radial_burst(stdscr, audio_data: np.ndarray, height: int, width: int, y
     # Lower cap (calmer density)
     particles = new_particles[-450:]
 
-    simple = state.get('simple_ascii')
-
-    # Render particles on top (sharper stars)
-    for p in particles:
-        life_ratio = p[4] / p[5]
-        b = max(0.0, 1.0 - life_ratio)
+    # Render particles on top (sharper stars), all particles' intensity,
+    # color and glyph computed at once
+    if particles:
+        pa = np.array(particles, dtype=float)
+        px, life, burst_factor = pa[:, 0], pa[:, 4], pa[:, 6]
+        b = np.maximum(0.0, 1.0 - life / pa[:, 5])
         # Softer twinkle; modulated by shimmer (high freq energy)
-        twinkle = 0.4 + 0.3 * np.sin(p[4] * (0.25 + 0.4 * shimmer) + p[0] * 0.05)
-        burst_factor = p[6] if len(p) > 6 else 0.0
+        twinkle = 0.4 + 0.3 * np.sin(life * (0.25 + 0.4 * shimmer) + px * 0.05)
         # Early life emphasis for burst particles
-        early = 1.0 if p[4] < 6 else np.exp(- (p[4]-6) * 0.05)
-        intensity = min(1.0, b * (0.55 + twinkle) * (1.0 + burst_factor * 0.9 * early))
+        early = np.where(life < 6, 1.0, np.exp(-(life - 6) * 0.05))
+        intensity = np.minimum(1.0, b * (0.55 + twinkle) * (1.0 + burst_factor * 0.9 * early))
         # Slight hue/position modulation by burst factor not implemented (color func handles position)
-        color = get_color_func(intensity * (0.85 + 0.15 * burst_factor) + shimmer * 0.1,
-                               p[0] / max(1, width - 1))
-        x_i = int(p[0])
-        y_i = int(p[1])
-        if 0 <= x_i < width and 0 <= y_i < height:
-            if simple:
-                if intensity > 0.7: ch = '*'
-                elif intensity > 0.4: ch = '+'
-                else: ch = '.'
-            else:
-                if intensity > 0.75: ch = '✦'
-                elif intensity > 0.5: ch = '✧'
-                elif intensity > 0.3: ch = '•'
-                else: ch = '·'
+        colors = colors_for(state.color_scheme,
+                            intensity * (0.85 + 0.15 * burst_factor) + shimmer * 0.1,
+                            px / max(1, width - 1))
+        if state.simple_ascii:
+            glyphs = _ASCII_GLYPHS[np.searchsorted(_ASCII_STEPS, intensity, side='left')]
+        else:
+            glyphs = _STAR_GLYPHS[np.searchsorted(_STAR_STEPS, intensity, side='left')]
+        xs = px.astype(int)
+        ys = pa[:, 1].astype(int)
+        visible = np.flatnonzero((xs >= 0) & (xs < width) & (ys >= 0) & (ys < height))
+        for x_i, y_i, ch, color in zip(xs[visible].tolist(), ys[visible].tolist(),
+                                       glyphs[visible].tolist(), colors[visible].tolist()):
             try:
-                stdscr.addch(y_i + y_offset, x_i, ord(ch), color)
+                stdscr.addch(y_i + y_offset, x_i, ch, color)
             except curses.error:
                 pass
 
@@ -2,8 +2,16 @@
 
 import numpy as np
 import curses
-from audio_visualizer.dsp.bars import compute_frequency_bars
+from .base import draw_cells
+from audio_visualizer.dsp.bars import compute_frequency_bars, smooth_neighbors
 from audio_visualizer.dsp.adaptive_eq import apply_adaptive_eq
+from audio_visualizer.render.colors import colors_for
+
+# Bar glyphs by relative height: solid lower, lighter upper regions
+_BLOCK_STEPS = np.array([0.55, 0.8])
+_BLOCK_GLYPHS = np.array([ord('█'), ord('▓'), ord('░')])
+_ASCII_STEPS = np.array([0.7])
+_ASCII_GLYPHS = np.array([ord('|'), ord(':')])
 
 
 def draw_spectrum(stdscr, audio_data: np.ndarray, height: int, width: int, y_offset: int,
@@ -15,17 +23,10 @@ def draw_spectrum(stdscr, audio_data: np.ndarray, height: int, width: int, y_off
     bar_heights = apply_adaptive_eq(bar_heights, state)
     bar_heights = apply_smoothing_func(bar_heights, False)
     # Light spatial neighbor smoothing for less jagged high end (responsive attack retained)
-    if len(bar_heights) > 4:
-        original = bar_heights.copy()
-        for i in range(1, len(bar_heights)-1):
-            frac = i / max(1, len(bar_heights)-1)
-            w = 0.12 + 0.3 * (frac ** 1.1)
-            local_avg = (original[i-1] + original[i] + original[i+1]) / 3.0
-            bar_heights[i] = (1 - w) * original[i] + w * local_avg
-    state['last_bar_values'] = bar_heights.copy()
+    smooth_neighbors(bar_heights, 0.12, 0.3)
     
-    # Track peak values for spectrum analyzer effect
-    if 'peak_values' not in state:
+    # Track peak values for spectrum analyzer effect (reset when the bar count changes)
+    if 'peak_values' not in state or len(state['peak_values']) != num_bars:
         state['peak_values'] = np.zeros(num_bars)
         state['peak_decay'] = np.zeros(num_bars)
     
@@ -42,52 +43,42 @@ def draw_spectrum(stdscr, audio_data: np.ndarray, height: int, width: int, y_off
             peak_decay[i] += 0.008
             peak_values[i] = max(0, peak_values[i] - peak_decay[i])
     
-    # Clear entire area + draw faint horizontal grid every 4 rows for readability
-    for row in range(height):
-        is_grid = (row % 4 == 0 and row not in (0, height-1))
-        for col in range(width):
-            try:
-                if is_grid:
-                    stdscr.addch(row + y_offset, col, ord('·'), curses.color_pair(7) | curses.A_DIM)
-                else:
-                    stdscr.addch(row + y_offset, col, ord(' '))
-            except curses.error:
-                pass
+    # Frame as code point / attr grids, written one attr run at a time
+    codes = np.full((height, width), ord(' '))
+    attrs = np.zeros((height, width), dtype=np.int64)
+    # Faint horizontal grid every 4 rows for readability
+    grid_rows = np.arange(height) % 4 == 0
+    grid_rows[[0, -1]] = False
+    codes[grid_rows] = ord('·')
+    attrs[grid_rows] = curses.color_pair(7) | curses.A_DIM
+    
+    # Bars with gaps (every other column)
+    bar_cols = np.arange(num_bars) * 2
+    positions = np.arange(num_bars) / max(1, num_bars - 1)
+    bar_cells = (bar_heights * height).astype(int)
+    # Cell (row, bar) lies k = height - row rows above the bottom edge
+    k = np.arange(height, 0, -1)[:, None]
+    lit = k <= bar_cells[None, :]
+    rel = k / np.maximum(1, bar_cells[None, :])
+    # Gradient bar: glyph picked by the cell's relative height within the bar
+    if state.simple_ascii:
+        glyphs = _ASCII_GLYPHS[np.searchsorted(_ASCII_STEPS, rel, side='right')]
+    else:
+        glyphs = _BLOCK_GLYPHS[np.searchsorted(_BLOCK_STEPS, rel, side='right')]
+    levels = bar_heights * 0.6 + (rel * 0.4).astype(bar_heights.dtype)
+    colors = colors_for(state.color_scheme, levels, positions)
+    codes[:, bar_cols] = np.where(lit, glyphs, codes[:, bar_cols])
+    attrs[:, bar_cols] = np.where(lit, colors, attrs[:, bar_cols])
+    
+    # Peak indicators
+    peak_cells = (peak_values * height).astype(int)
+    peak_rows = height - peak_cells
+    shown = (peak_rows >= 0) & (peak_rows < height)
+    markers = np.where(peak_cells > bar_cells, ord('▲'), ord('·'))
+    peak_colors = colors_for(state.color_scheme, peak_values, positions)
+    codes[peak_rows[shown], bar_cols[shown]] = markers[shown]
+    attrs[peak_rows[shown], bar_cols[shown]] = peak_colors[shown]
     
-    # Draw bars with gaps (every other column)
-    for bar_idx in range(num_bars):
-        col = bar_idx * 2  # Leave gap
-        
-        if col >= width:
-            break
-        
-        height_ratio = bar_heights[bar_idx]
-        bar_height = int(height_ratio * height)
-        peak_height = int(peak_values[bar_idx] * height)
-        position = bar_idx / max(1, num_bars - 1)
-        
-        # Draw gradient bar using two glyph regions: solid lower, light upper
-        simple = state.get('simple_ascii')
-        for row in range(height):
-            if height - row <= bar_height:
-                rel = (height - row) / max(1, bar_height)
-                if simple:
-                    glyph = '|' if rel < 0.7 else ':'
-                else:
-                    glyph = '█' if rel < 0.55 else ('▓' if rel < 0.8 else '░')
-                row_level = min(1.0, (height_ratio * 0.6) + rel * 0.4)
-                color = get_color_func(row_level, position)
-                try:
-                    stdscr.addch(row + y_offset, col, ord(glyph), color)
-                except curses.error:
-                    pass
-        
-        # Draw peak indicator
-        peak_row = height - peak_height
-        if 0 <= peak_row < height:
-            try:
-                peak_color = get_color_func(peak_values[bar_idx], position)
-                marker_char = '▲' if peak_height > bar_height else '·'
-                stdscr.addch(peak_row + y_offset, col, ord(marker_char), peak_color)
-            except curses.error:
-                pass
\ No newline at end of file
+    # Only rows that changed since the last frame are rewritten
+    draw_cells(stdscr, y_offset, 0, codes, attrs, width, state.get('cells'))
+    state['cells'] = (codes, attrs)
@@ -10,22 +10,30 @@ def draw_waveform(stdscr, audio_data: np.ndarray, height: int, width: int, y_off
     """Draw smooth continuous waveform line."""
     # Get waveform data
     if len(audio_data) > width:
+        # One sample per column: the largest-magnitude sample of each block,
+        # so short peaks between columns are not skipped over
         step = len(audio_data) // width
-        waveform = audio_data[::step][:width]
+        blocks = audio_data[:step * width].reshape(width, step)
+        waveform = blocks[np.arange(width), np.abs(blocks).argmax(axis=1)]
     else:
         waveform = np.pad(audio_data, (0, width - len(audio_data)), 'constant')
     
     # Heavy smoothing for less jitter (increased smoothing factor)
     if 'prev_waveform' not in state or len(state['prev_waveform']) != len(waveform):
+        # Both branches above build a new array, so it can seed the history
         state['prev_waveform'] = waveform
     else:
-        # Much higher smoothing (0.85 instead of using apply_smoothing_func)
-        waveform = 0.85 * state['prev_waveform'] + 0.15 * waveform
-        state['prev_waveform'] = waveform
+        # Much higher smoothing (0.85 instead of using apply_smoothing_func),
+        # updated in place in the stored history
+        prev = state['prev_waveform']
+        prev *= 0.85
+        prev += 0.15 * waveform
+        waveform = prev
     
-    # Normalize
-    if np.max(np.abs(waveform)) > 0:
-        waveform = waveform / np.max(np.abs(waveform))
+    # Normalize (new array: the history above must keep its scale)
+    peak = max(waveform.max(), -waveform.min())
+    if peak > 0:
+        waveform = waveform / peak
     
     middle = height // 2
     
@@ -33,6 +41,7 @@ def draw_waveform(stdscr, audio_data: np.ndarray, height: int, width: int, y_off
     clear_area(stdscr, y_offset, height, width)
     
     # Draw continuous waveform by connecting adjacent points
+    ch_line = ord('│')
     prev_row = None
     for col in range(min(width, len(waveform))):
         wave_value = waveform[col]
@@ -51,24 +60,25 @@ def draw_waveform(stdscr, audio_data: np.ndarray, height: int, width: int, y_off
             
             for row in range(start_row, end_row + 1):
                 try:
-                    stdscr.addch(row + y_offset, col, ord('│'), color)
+                    stdscr.addch(row + y_offset, col, ch_line, color)
                 except curses.error:
                     pass
         else:
             # First point
             try:
-                stdscr.addch(current_row + y_offset, col, ord('│'), color)
+                stdscr.addch(current_row + y_offset, col, ch_line, color)
             except curses.error:
                 pass
         
         prev_row = current_row
     
     # Draw dim center line
+    dim = curses.color_pair(7) | curses.A_DIM
     for col in range(width):
         try:
             ch = stdscr.inch(middle + y_offset, col)
             # Only draw if no waveform there
             if ch == ord(' '):
-                stdscr.addch(middle + y_offset, col, ord('─'), curses.color_pair(7) | curses.A_DIM)
+                stdscr.addch(middle + y_offset, col, ord('─'), dim)
         except curses.error:
             pass
\ No newline at end of file
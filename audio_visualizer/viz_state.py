@@ -0,0 +1,32 @@
+"""State object handed to every visualizer's draw function."""
+
+# Adaptive EQ mode -> (enabled, strength): 0 off, 1 medium, 2 strong
+_EQ_MODES = {0: (False, 0.0), 1: (True, 0.4)}
+_EQ_STRONG = (True, 0.65)
+
+
+class VizState(dict):
+    """Visualizer state: user preferences as slots, per-mode data as items.
+
+    The preference flags read every frame by the draw functions are slot
+    attributes, so they are plain attribute loads rather than dict lookups,
+    and they survive ``clear()``. Transient per-mode data (peaks, particles,
+    running means...) is stored as dict items and dropped with ``clear()``
+    when the mode changes.
+    """
+
+    __slots__ = ('adaptive_eq', 'adaptive_eq_mode', 'adaptive_eq_strength', 'simple_ascii',
+                 'color_scheme')
+
+    def __init__(self):
+        super().__init__()
+        self.simple_ascii = False
+        # Scheme name for render.colors.colors_for (set by the visualizer)
+        self.color_scheme = "multicolor"
+        # Default: medium adaptive EQ
+        self.set_eq_mode(1)
+
+    def set_eq_mode(self, mode: int):
+        """Select an adaptive EQ mode and the matching enable flag / strength."""
+        self.adaptive_eq_mode = mode
+        self.adaptive_eq, self.adaptive_eq_strength = _EQ_MODES.get(mode, _EQ_STRONG)